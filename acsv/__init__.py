@@ -1,7 +1,12 @@
 __version__ = "0.1.0"
 
+import sys
+
+# Checked once here rather than in every module; the package relies on match statements.
+assert sys.version_info >= (3, 10)
+
 from .exceptions import CsvError
-from .reader import Reader
+from .reader import Reader, parse_string
 from .dictreader import DictReader
 from .writer import Writer
 from .dictwriter import DictWriter
@@ -10,6 +15,7 @@ from . import util
 __all__ = [
     "CsvError",
     "Reader",
+    "parse_string",
     "DictReader",
     "Writer",
     "DictWriter",
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import csv
+from itertools import zip_longest
 from typing import Any, AsyncGenerator, Mapping, Optional, Sequence, TypeVar, Generic
 from .exceptions import CsvError
 from .reader import Reader
@@ -8,9 +9,12 @@ from ._protocols import AsyncFile
 RestVal = TypeVar("RestVal")
 
 class DictReader(Generic[RestVal]):
+    __slots__ = ("_reader", "_fieldnames", "_num_fields", "_restkey", "_restval")
+
     _fieldnames: Optional[Sequence[str]]
+    _num_fields: int
     _restkey: Optional[str]
-    _restVal: Optional[RestVal] = None
+    _restval: Optional[RestVal]
 
     RowType = Mapping[str | Any, str | Any]
 
@@ -31,25 +35,30 @@ class DictReader(Generic[RestVal]):
     ) -> None:
         self._reader = Reader(csvfile, dialect=dialect, **kwargs)
         self._fieldnames = fieldnames
+        self._num_fields = 0 if fieldnames is None else len(fieldnames)
         self._restkey = restkey
         self._restval = restval
 
     def _make_dict(self, row: Sequence[str]) -> RowType:
-        assert self._fieldnames is not None
-        if len(row) >= len(self._fieldnames):
-            d: dict[str | Any, str | Any]= dict(zip(self._fieldnames, row))
-            if len(row) > len(self._fieldnames):
-                remain = row[len(self._fieldnames):]
-                d[self._restkey] = list(remain)
+        fieldnames = self._fieldnames
+        assert fieldnames is not None
+        num_fields = self._num_fields
+        num_values = len(row)
+        if num_values == num_fields:
+            return dict(zip(fieldnames, row))
+        elif num_values > num_fields:
+            d: dict[str | Any, str | Any] = dict(zip(fieldnames, row))
+            d[self._restkey] = row[num_fields:]
             return d
         else:
-            return {f: row[index] if index < len(row) else self._restval for index, f in enumerate(self._fieldnames)}
+            return dict(zip_longest(fieldnames, row, fillvalue=self._restval))
 
 
     async def __aiter__(self) -> AsyncGenerator[RowType, None]:
         async for row in self._reader:
             if self._fieldnames is None:
                 self._fieldnames = row
+                self._num_fields = len(row)
             else:
                 yield self._make_dict(row)
     
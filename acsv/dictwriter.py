@@ -6,6 +6,7 @@ from .writer import Writer
 
 
 class DictWriter:
+    __slots__ = ("_writer", "_fieldnames", "_fieldnames_set", "_restval", "_extrasaction")
 
     RowType: TypeAlias = Mapping[str | Any, str | Any]
 
@@ -19,28 +20,26 @@ class DictWriter:
     ):
         self._writer = Writer(f, dialect)
         self._fieldnames = fieldnames
+        self._fieldnames_set = frozenset(fieldnames)
         self._restval = restval
         self._extrasaction = extrasaction
 
-    async def writerow(self, row: RowType) -> Optional[int]:
-        row = dict(row)
-        line = []
+    def _dict_to_list(self, row: RowType) -> list[str | Any]:
+        if self._extrasaction == "raise":
+            extras = row.keys() - self._fieldnames_set
+            if extras:
+                raise CsvError(f"Unused keys in row: {extras}")
 
-        for key in self._fieldnames:
-            line.append(row.pop(key, self._restval))
-        
-        if self._extrasaction == "raise" and row:
-            raise CsvError(f"Unused keys in row: {row.keys()}")
+        restval = self._restval
+        return [row.get(key, restval) for key in self._fieldnames]
 
-        return await self._writer.writerow(line)
+    async def writerow(self, row: RowType) -> Optional[int]:
+        return await self._writer.writerow(self._dict_to_list(row))
 
     async def writerows(self, rows: Iterable[RowType]) -> int:
-        res = 0
-        for row in rows:
-            num = await self.writerow(row)
-            if num is None:
-                raise CsvError("writerow returned None")
-            res += num
+        res = await self._writer.writerows(self._dict_to_list(row) for row in rows)
+        if res is None:
+            raise CsvError("writerows returned None")
 
         return res
 
@@ -1,137 +1,242 @@
 #!/usr/bin/env python3
 import asyncio
 import csv as _csv
-import io
-import sys
-from enum import Enum, auto
-from typing import cast, AsyncGenerator, Awaitable, Iterable, Optional, Sequence, Tuple, TypeVar
+import re
+from collections import deque
+from typing import AsyncGenerator, Final, MutableSequence, NoReturn, Optional, Sequence
 from .exceptions import CsvError
 from ._protocols import AsyncFile
-from .dialect import get_dialect
-
-assert sys.version_info >= (3, 10)
-
-
-class _Token(Enum):
-    CHAR = auto()
-    DELIMITER = auto()
-    QUOTE = auto()
-    ESCAPE_CHAR = auto()
-    CR = auto()
-    LF = auto()
-    EOF = auto()
-    WS = auto()
-
-
-class _Scanner:
-    dialect: _csv.Dialect
-    csvfile: AsyncFile
-    buffer_size: int
-    buffer: Optional[str]
-    pos: int = 0
-    _next_fill: Optional[asyncio.Task[str]]
-    line_start: int = 0
-    line: int = 1
-    bpos: int = 0
-
-    Self = TypeVar("Self", bound="_Scanner")
-
-    @property
-    def current(self) -> str:
-        if self.buffer is None:
-            return ""
-        return self.buffer[self.bpos]
-
-    def __init__(self, dialect: _csv.Dialect, csvfile: AsyncFile, buffer_size: int = 4096) -> None:
+from .dialect import _Dialect, get_dialect
+from .util import none_throws
+
+
+class _State:
+    """
+    Parser states. Plain ints rather than an Enum, since they are compared for every
+    special character.
+    """
+    BEGIN_FIELD: Final = 0
+    FIELD: Final = 1
+    QUOTED_FIELD: Final = 2
+    EXPECT_QUOTE_OR_FIELD_TERM: Final = 3
+    # The escape states must stay last; the parser tests for both with >= ESCAPE.
+    ESCAPE: Final = 4
+    QUOTED_ESCAPE: Final = 5
+
+
+_STATE_NAMES = {value: name for name, value in vars(_State).items() if not name.startswith("_")}
+
+
+_BUFFER_SIZE = 65536
+
+
+def _char_class(*chars: Optional[str]) -> re.Pattern[str]:
+    return re.compile("[" + re.escape("".join(c for c in chars if c)) + "]")
+
+
+class _Parser:
+    """
+    Parser state shared by Reader and parse_string. Input is handed over in chunks of
+    any size; a row split across chunks is continued by the next one.
+    """
+    __slots__ = (
+        "dialect",
+        "line_num",
+        "_special",
+        "_quoted_special",
+        "_line",
+        "_field",
+        "_state",
+        "_in_row",
+    )
+
+    dialect: _Dialect
+    line_num: int
+    _line: list[str]
+    _field: list[str]
+    _state: int
+    _in_row: bool
+
+    def __init__(self, dialect: _Dialect) -> None:
         self.dialect = dialect
-        self.csvfile = csvfile
-        self.buffer_size = buffer_size
-        self.buffer = None
-
-    async def __aenter__(self: Self) -> Self:
-        self._next_fill = asyncio.create_task(self.csvfile.read(self.buffer_size))
-        return self
-
-    async def __aexit__(self, *_) -> None:
-        if self._next_fill is not None:
-            self._next_fill.cancel()
-            try:
-                await self._next_fill
-            except asyncio.exceptions.CancelledError:
-                pass
-            self._next_fill = None
-
-    async def _advance(self) -> bool:
-        if self.buffer is None:
-            return await self._fill()
-        else:
-            self.pos += 1
-            self.bpos += 1
-            if self.bpos == len(self.buffer):
-                return await self._fill()
-            return True
-
-    async def _fill(self) -> bool:
-        if self._next_fill is None:
-            return False
-
-        self.bpos = 0
-        self.buffer = await cast(Awaitable[str], self._next_fill)
-        if len(self.buffer) == 0:
-            self._next_fill = None
-            return False
-        else:
-            self._next_fill = asyncio.create_task(self.csvfile.read(self.buffer_size)) 
-            return True
-
-    async def __aiter__(self) -> AsyncGenerator[Tuple[_Token, str, int, int], None]:
+        self.line_num = 0
+        # Characters that end a run of ordinary field content, outside and inside of quotes.
+        self._special = _char_class(dialect.delimiter, dialect.quotechar, dialect.escapechar, "\r", "\n")
+        self._quoted_special = _char_class(dialect.quotechar, dialect.escapechar, "\r", "\n")
+        self._line = []
+        self._field = []
+        self._state = _State.BEGIN_FIELD
+        self._in_row = False
+
+    def _bad_state(self, char: str, state: int, reason: Optional[str] = None) -> NoReturn:
+        raise CsvError(f"Bad Format: {char=} @ line_no={self.line_num + 1} state={_STATE_NAMES[state]} {reason=}")
+
+    def parse_chunk(self, buffer: str, rows: MutableSequence[Sequence[str]]) -> None:
+        """
+        Parses a chunk of input, appending the rows completed by it to rows. A partially
+        read row is kept and continued by the next chunk.
+        """
+        # Bind everything used per special character to locals.
         dialect = self.dialect
-        while True:
-            if not await self._advance():
-                yield _Token.EOF, "", self.line, self.pos - self.line_start
-                break
-
-            char = self.current
-            token: _Token
-            match (char):
-                case (dialect.quotechar):
-                    token = _Token.QUOTE
-                case (dialect.escapechar) if dialect.escapechar:
-                    token = _Token.ESCAPE_CHAR
-                case (None):
-                    token = _Token.EOF
-                case '\r':
-                    token = _Token.CR
-                case '\n':
-                    self.line += 1
-                    self.line_start = self.pos
-                    token = _Token.LF
-                case (dialect.delimiter):
-                    token = _Token.DELIMITER
-                case ' ':
-                    token = _Token.WS
-
-                case _:
-                    token = _Token.CHAR
-
-            yield token, char, self.line, self.pos - self.line_start
-
-
-class _State(Enum):
-    BEGIN_FIELD = auto()
-    FIELD = auto()
-    QUOTED_FIELD = auto()
-    EXPECT_QUOTE_OR_FIELD_TERM = auto()
-    ESCAPE = auto()
+        delimiter = dialect.delimiter
+        quotechar = dialect.quotechar
+        escapechar = dialect.escapechar
+        skipinitialspace = dialect.skipinitialspace
+        search_special = self._special.search
+        search_quoted_special = self._quoted_special.search
+        line = self._line
+        field = self._field
+        state = self._state
+        pos = 0
+        row_end = 0
+        size = len(buffer)
+
+        try:
+            while pos < size:
+                if state == _State.BEGIN_FIELD and not line:
+                    # A whole record without quotes or escapes can simply be split.
+                    end = buffer.find("\n", pos)
+                    if end >= 0:
+                        record = buffer[pos:end]
+                        if (
+                            (quotechar is None or quotechar not in record)
+                            and (escapechar is None or escapechar not in record)
+                        ):
+                            if "\r" in record:
+                                record = record.replace("\r", "")
+                            values = record.split(delimiter)
+                            if skipinitialspace:
+                                values = [value.lstrip(" ") for value in values]
+                            rows.append(values)
+                            self.line_num += 1
+                            pos = row_end = end + 1
+                            continue
+
+                if state >= _State.ESCAPE:
+                    # Exactly one character is taken literally, as the csv module does; what
+                    # follows is searched as usual for the state the escape came from.
+                    char = buffer[pos]
+                    pos += 1
+                    if char == "\n":
+                        self.line_num += 1
+                    field.append(char)
+                    state = _State.FIELD if state == _State.ESCAPE else _State.QUOTED_FIELD
+                    continue
+
+                # Copy everything up to the next special character in one slice.
+                if state != _State.QUOTED_FIELD:
+                    found = search_special(buffer, pos)
+                    end = size if found is None else found.start()
+                elif escapechar is None:
+                    # Without escapes only a quote ends a quoted run, line breaks included.
+                    end = buffer.find(none_throws(quotechar), pos)
+                    if end < 0:
+                        end = size
+                else:
+                    found = search_quoted_special(buffer, pos)
+                    end = size if found is None else found.start()
+
+                if end > pos:
+                    run = buffer[pos:end]
+                    if state == _State.BEGIN_FIELD:
+                        if skipinitialspace:
+                            run = run.lstrip(" ")
+                        if run:
+                            field.append(run)
+                            state = _State.FIELD
+                    elif state == _State.FIELD:
+                        field.append(run)
+                    elif state == _State.QUOTED_FIELD:
+                        self.line_num += run.count("\n")
+                        if "\r" in run:
+                            run = run.replace("\r", "")
+                        field.append(run)
+                    elif state == _State.EXPECT_QUOTE_OR_FIELD_TERM and not run.strip(" "):
+                        field.append(run)
+                    else:
+                        # Only a closing quote leads here; report what follows its spaces.
+                        self._bad_state(run.lstrip(" ")[0], state)
+
+                    pos = end
+                    if end == size:
+                        break
+
+                # Only special characters get here; the most common are tested first.
+                char = buffer[pos]
+                pos += 1
+                if char == delimiter:
+                    line.append("".join(field))
+                    field.clear()
+                    state = _State.BEGIN_FIELD
+                elif char == "\n":
+                    self.line_num += 1
+                    if state == _State.QUOTED_FIELD:
+                        field.append(char)
+                    else:
+                        line.append("".join(field))
+                        field.clear()
+                        state = _State.BEGIN_FIELD
+                        rows.append(line)
+                        line = []
+                        row_end = pos
+                elif char == quotechar:
+                    if state == _State.QUOTED_FIELD:
+                        state = _State.EXPECT_QUOTE_OR_FIELD_TERM
+                    elif state == _State.BEGIN_FIELD:
+                        state = _State.QUOTED_FIELD
+                    elif state == _State.EXPECT_QUOTE_OR_FIELD_TERM:
+                        field.append(char)
+                        state = _State.QUOTED_FIELD
+                    else:
+                        self._bad_state(char, state)
+                elif char == "\r":
+                    continue
+                elif char == escapechar and state != _State.EXPECT_QUOTE_OR_FIELD_TERM:
+                    state = _State.QUOTED_ESCAPE if state == _State.QUOTED_FIELD else _State.ESCAPE
+                else:
+                    self._bad_state(char, state)
+        finally:
+            self._line = line
+            self._state = state
+            # Whether the open row has consumed any input, even if only skipped spaces.
+            self._in_row = pos > row_end or (row_end == 0 and self._in_row)
+
+    def finish(self, rows: MutableSequence[Sequence[str]]) -> None:
+        """
+        Completes the row left over at the end of input, if any.
+        """
+        if not (self._in_row or self._line or self._field or self._state != _State.BEGIN_FIELD):
+            return
+
+        self._line.append("".join(self._field))
+        rows.append(self._line)
+        self._field.clear()
+        self._line = []
+        self._state = _State.BEGIN_FIELD
+        self._in_row = False
 
 
 class Reader:
+    __slots__ = (
+        "_csvfile",
+        "_buffer_size",
+        "dialect",
+        "_parser",
+        "_fieldnames",
+        "_pending",
+        "_next_fill",
+        "_eof",
+        "_error",
+    )
+
     _csvfile: AsyncFile
-    dialic: _csv.Dialect
-    line_num: int = 0
-    _buffer: str
-    _pos: int = 0
-    _fieldnames: Optional[Sequence[str]] = None
+    dialect: _Dialect
+    _parser: _Parser
+    _fieldnames: Optional[Sequence[str]]
+    _pending: deque[Sequence[str]]
+    _next_fill: Optional[asyncio.Task[str]]
+    _eof: bool
+    _error: Optional[CsvError]
 
     @property
     def fieldnames(self) -> Sequence[str]:
@@ -139,108 +244,108 @@ class Reader:
             raise CsvError("fieldnames is not available until first row has been read.")
         return self._fieldnames
 
+    @property
+    def line_num(self) -> int:
+        return self._parser.line_num
+
     def __init__(
             self, 
             csvfile: AsyncFile, 
             dialect: str | _csv.Dialect = "excel",
+            buffer_size: int = _BUFFER_SIZE,
             **kwargs,
         ) -> None:
         self._csvfile = csvfile
+        self._buffer_size = buffer_size
         self.dialect = get_dialect(dialect, **kwargs)
+        self._parser = _Parser(self.dialect)
+        self._fieldnames = None
+        self._pending = deque()
+        self._next_fill = None
+        self._eof = False
+        self._error = None
+
+    async def _read_more(self, prefetch: bool = True) -> bool:
+        """
+        Reads and parses the next buffer, adding the rows it completes to the pending
+        rows. Returns False once the input is exhausted. With prefetch, the following
+        read is started before parsing.
+        """
+        if self._error is not None:
+            raise self._error
+        if self._eof:
+            return False
 
-    async def __aiter__(self) -> AsyncGenerator[Sequence[str], None]:
-        line: list[str] = []
-        field = io.StringIO()
-        state = _State.BEGIN_FIELD
-
-        def emit(character: str) -> None:
-            nonlocal state, field
-            field.write(character)
-            if state == _State.BEGIN_FIELD:
-                state = _State.FIELD
-
-        def new_field() -> None:
-            nonlocal line, field, state
-            line.append(field.getvalue())
-            field.truncate(0)
-            field.seek(0)
-            state = _State.BEGIN_FIELD
-
-        def new_line() -> Iterable[Sequence[str]]:
-            nonlocal line, self
-            if self._fieldnames is None:
-                self._fieldnames = line
-
-            if line:
-                yield line
-            line = []
-
-        def bad_state(token, char, line_no, col, reason: Optional[str] = None):
-            nonlocal state
-            raise CsvError(f"Bad Format: {token} {char=} @ {line_no=}:{col=} {state=} {reason=}")
-
-        async with _Scanner(self.dialect, self._csvfile) as scanner:
-            async for token, char, line_no, col in scanner:
-                print(f"{token=} {char=}, {line_no=}, {col=}")
-                match token:
-                    case _Token.CHAR if state == _State.EXPECT_QUOTE_OR_FIELD_TERM:
-                        bad_state(token, char, line_no, col)
-
-                    case _Token.CHAR:
-                        emit(char)
-
-                    case _Token.DELIMITER if state in (_State.QUOTED_FIELD, _State.ESCAPE):
-                        emit(self.dialect.delimiter)
-
-                    case _Token.DELIMITER if state == _State.EXPECT_QUOTE_OR_FIELD_TERM:
-                        new_field()
-
-                    case _Token.DELIMITER:
-                        new_field()
-
-                    case _Token.QUOTE if state == _State.BEGIN_FIELD:
-                        state = _State.QUOTED_FIELD
-                    
-                    case _Token.QUOTE if state == _State.FIELD:
-                        bad_state(token, char, line_no, col)
-
-                    case _Token.QUOTE if state == _State.QUOTED_FIELD:
-                        state = _State.EXPECT_QUOTE_OR_FIELD_TERM
-
-                    case _Token.QUOTE if state == _State.EXPECT_QUOTE_OR_FIELD_TERM:
-                        state = _State.QUOTED_FIELD
-                        field.write(char)
-
-                    case _Token.ESCAPE_CHAR if self.dialect.escapechar and state == _State.ESCAPE:
-                        field.write(self.dialect.escapechar)
-
-                    case _Token.ESCAPE_CHAR if self.dialect.escapechar and state != _State.ESCAPE:
-                        state = _State.ESCAPE
+        next_fill = self._next_fill
+        if next_fill is None:
+            next_fill = asyncio.create_task(self._csvfile.read(self._buffer_size))
+        # The read now belongs to this call, so closing an iterator meanwhile leaves it be.
+        self._next_fill = None
+        buffer = await next_fill
+        pending = self._pending
+        try:
+            if buffer:
+                # Start the next read before parsing so the two overlap.
+                self._next_fill = (
+                    asyncio.create_task(self._csvfile.read(self._buffer_size)) if prefetch else None
+                )
+                self._parser.parse_chunk(buffer, pending)
+            else:
+                self._eof = True
+                self._parser.finish(pending)
+        except CsvError as e:
+            # Rows completed before the bad one are still handed out first.
+            self._error = e
+            if not pending:
+                raise
+
+        if pending and self._fieldnames is None:
+            self._fieldnames = pending[0]
+        return True
+
+    async def _settle_fill(self) -> None:
+        """
+        Waits for a read started ahead by iteration. Cancelling it would not stop a read
+        that is already underway, only lose its text, so the result is kept for the next
+        _read_more instead.
+        """
+        next_fill = self._next_fill
+        if next_fill is not None:
+            await asyncio.wait((next_fill,))
+
+    async def read_many(self, n: int = 1024) -> list[Sequence[str]]:
+        """
+        Returns the next n rows in one list, or fewer at the end of input. An empty list
+        means there are no rows left. Unlike iteration, this does not read ahead, so no
+        read is left running between calls.
+        """
+        pending = self._pending
+        while len(pending) < n:
+            if self._error is not None and pending:
+                # Hand out the rows before the bad one; the next call raises.
+                break
+            if not await self._read_more(prefetch=False):
+                break
 
-                    case _Token.CR:
-                        continue
+        return [pending.popleft() for _ in range(min(n, len(pending)))]
 
-                    case _Token.LF:
-                        self.line_num += 1
-                        if state == _State.QUOTED_FIELD:
-                            field.write("\n")
-                        else:
-                            new_field()
-                            for l in new_line():
-                                yield l
-
-                    case _Token.WS if self.dialect.skipinitialspace and state == _State.BEGIN_FIELD:
-                        pass
-                
-                    case _Token.WS:
-                        emit(char)
-
-                    case _Token.EOF:
-                        new_field()
-                        for l in new_line():
-                            yield l
-                        return
-
-                    case _:
-                        bad_state(token, char, line_no, col, "Unknown token")
-    
\ No newline at end of file
+    async def __aiter__(self) -> AsyncGenerator[Sequence[str], None]:
+        pending = self._pending
+        try:
+            while pending or await self._read_more():
+                while pending:
+                    yield pending.popleft()
+        finally:
+            await self._settle_fill()
+
+
+def parse_string(text: str, dialect: str | _csv.Dialect = "excel", **kwargs) -> list[Sequence[str]]:
+    """
+    Parses CSV that is already in memory, without going through the event loop.
+    Accepts the same dialect arguments as Reader.
+    """
+    parser = _Parser(get_dialect(dialect, **kwargs))
+    rows: list[Sequence[str]] = []
+    parser.parse_chunk(text, rows)
+    parser.finish(rows)
+    return rows
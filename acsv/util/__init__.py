@@ -1,10 +1,7 @@
 import asyncio
 import io
-import sys
 from typing import AsyncIterable, AsyncIterator, Literal, Optional, Tuple, TypeAlias, TypeVar, Union
 
-assert sys.version_info >= (3, 10)
-
 # lifted from _typeshed.builtins
 OpenTextModeUpdating: TypeAlias = Literal[
     "r+",
@@ -50,15 +47,20 @@ AsyncTextFileSelf = TypeVar("AsyncTextFileSelf", bound="AsyncTextFile")
 class AsyncTextFile:
     """
     Simple async wrapper around text based files for testing.
+
+    Only opening and closing are handed to a worker thread. Reads and writes of a local
+    file are quick enough that a thread round trip per call costs more than blocking
+    the event loop for them.
     """
     _file: io.TextIOBase
 
-    def __init__(self, filename: str, mode: OpenTextMode = "r") -> None: 
+    def __init__(self, filename: str, mode: OpenTextMode = "r", buffering: int = -1) -> None: 
         self.filename = filename
         self.mode = mode
+        self.buffering = buffering
 
     async def __aenter__(self: AsyncTextFileSelf) -> AsyncTextFileSelf:
-        self._file = await asyncio.to_thread(open, self.filename, self.mode)
+        self._file = await asyncio.to_thread(open, self.filename, self.mode, self.buffering)
         return self
 
     async def __aexit__(self, *args) -> None:
@@ -66,10 +68,14 @@ class AsyncTextFile:
         await asyncio.to_thread(close, self._file, *args)
 
     async def read(self, size: int) -> str:
-        return await asyncio.to_thread(self._file.read, size)
+        """
+        Blocks while reading, so size should be at least a page but not so large that
+        other tasks are held up for long.
+        """
+        return self._file.read(size)
     
     async def write(self, data: str) -> int:
-        return await asyncio.to_thread(self._file.write, data)
+        return self._file.write(data)
 
 
 
@@ -95,16 +101,17 @@ class AsyncStringIO:
         type(self._file).__exit__(self._file, *args)
 
     async def read(self, size: int = -1) -> str:
-        return await asyncio.to_thread(self._file.read, size)
+        # The data is already in memory, so there is nothing worth waiting on a thread for.
+        return self._file.read(size)
 
     async def readline(self, size: int = -1) -> str:
-        return await asyncio.to_thread(self._file.readline, size)
+        return self._file.readline(size)
 
     async def write(self, value: str) -> int:
-        return await asyncio.to_thread(self._file.write, value)
+        return self._file.write(value)
 
     async def getvalue(self) -> str:
-        return await asyncio.to_thread(self._file.getvalue)
+        return self._file.getvalue()
 
 
 T = TypeVar("T")
@@ -1,4 +1,5 @@
 import csv as _csv
+import re
 from io import StringIO
 from typing import Iterable, Optional, TypeAlias, Union
 from .exceptions import CsvError
@@ -7,7 +8,27 @@ from ._protocols import AsyncFile
 
 # TODO: handle complex numbers?
 
+_WRITE_BUFFER_SIZE = 65536
+
+
+def _add_written(total: Optional[int], num: Optional[int]) -> Optional[int]:
+    return None if total is None or num is None else total + num
+
+
 class Writer:
+    __slots__ = (
+        "_csvfile",
+        "dialect",
+        "_quotechar",
+        "_delimiter",
+        "_escape_doublequote",
+        "_escape_quote_sequence",
+        "_escape_delimiter_sequence",
+        "_needs_newline",
+        "_needs_quotes",
+        "_quote",
+    )
+
     dialect: _csv.Dialect
 
     ValueType: TypeAlias = Union[str, float, int]
@@ -16,11 +37,22 @@ class Writer:
     def __init__(self, csvfile: AsyncFile, dialect: str | _csv.Dialect = "excel") -> None:
         self._csvfile = csvfile
         self.dialect = _csv.get_dialect(dialect) if isinstance(dialect, str) else dialect
-        self._escape_doublequote = None if self.dialect.quotechar is None else self.dialect.quotechar * 2
-        self._escape_quote_sequence = None if self.dialect.escapechar is None else self.dialect.escapechar + none_throws(self.dialect.quotechar)
-        self._escape_delimiter_sequence = None if self.dialect.escapechar is None else self.dialect.escapechar + none_throws(self.dialect.delimiter)
+        if self.dialect.quotechar is None and self.dialect.quoting != _csv.QUOTE_NONE:
+            raise CsvError("quotechar must be set if quoting enabled")
+
+        # Looked up once here rather than by the _quote_* methods for every value.
+        escapechar = self.dialect.escapechar
+        self._quotechar = self.dialect.quotechar or ""
+        self._delimiter = self.dialect.delimiter
+        self._escape_doublequote = self._quotechar * 2
+        self._escape_quote_sequence = None if escapechar is None else escapechar + self._quotechar
+        self._escape_delimiter_sequence = None if escapechar is None else escapechar + self._delimiter
         doublequote = self.dialect.doublequote
         self._needs_newline = False
+        # Any of these characters in a value forces it to be quoted under QUOTE_MINIMAL.
+        self._needs_quotes = re.compile(
+            "[" + re.escape(self._delimiter + self._quotechar + "\r\n") + "]"
+        )
 
         match self.dialect.quoting:
             case _csv.QUOTE_ALL if doublequote:
@@ -48,45 +80,42 @@ class Writer:
                 raise CsvError(f"Unsupported quoting: {self.dialect.quoting} {doublequote=}")
 
     def _quote_all_doublequote(self, value: str | int | float) -> str:
-        quotechar = none_throws(self.dialect.quotechar)
+        quotechar = self._quotechar
         value = str(value)
-        value = value.replace(quotechar, none_throws(self._escape_doublequote))
+        value = value.replace(quotechar, self._escape_doublequote)
         return "".join([quotechar, value, quotechar])
 
     def _quote_all_escape(self, value: str | int | float) -> str:
-        quotechar = none_throws(self.dialect.quotechar)
+        quotechar = self._quotechar
         value = str(value)
         if quotechar in value:
-            escapeseq = none_throws(self._escape_doublequote)
+            escapeseq = self._escape_doublequote
             value = value.replace(quotechar, escapeseq)
         return "".join([quotechar, value, quotechar])
 
     def _quote_minimal_doublequote(self, value: str | int | float) -> str:
-        quotechar = none_throws(self.dialect.quotechar)
-        value = str(value)
-        need_quotes = False
-        if quotechar in value:
-            need_quotes = True
-            escapeseq = none_throws(self._escape_doublequote)
-            value = value.replace(quotechar, escapeseq)
+        if not isinstance(value, str):
+            value = str(value)
+        if self._needs_quotes.search(value) is None:
+            return value
 
-        if self.dialect.delimiter in value:
-            need_quotes = True
-
-        if need_quotes:
-            return "".join([quotechar, value, quotechar])
-        
-        return value
+        quotechar = self._quotechar
+        value = value.replace(quotechar, self._escape_doublequote)
+        return "".join([quotechar, value, quotechar])
 
     def _quote_minimal_escape(self, value: str | int | float) -> str:
-        quotechar = none_throws(self.dialect.quotechar)
-        value = str(value)
+        if not isinstance(value, str):
+            value = str(value)
+        if self._needs_quotes.search(value) is None:
+            return value
+
+        quotechar = self._quotechar
         need_quotes = False
         if quotechar in value:
             escapeseq = none_throws(self._escape_quote_sequence)
             value = value.replace(quotechar, escapeseq)
 
-        if self.dialect.delimiter in value:
+        if self._delimiter in value:
             need_quotes = True
 
         if need_quotes:
@@ -108,41 +137,40 @@ class Writer:
 
     def _quote_none(self, value: str | int | float) -> str:
         value = str(value)
-        delimiter = self.dialect.delimiter
+        delimiter = self._delimiter
         if delimiter in value:
             escapeseq = none_throws(self._escape_delimiter_sequence)
             return value.replace(delimiter, escapeseq)
         return value
 
     def _formatrow(self, row: RowType) -> str:
-        delimiter = self.dialect.delimiter
-        line = StringIO()
-        if self._needs_newline:
-            line.write(self.dialect.lineterminator)
-
-        iter_ = iter(row)
-
-        try:
-            value = next(iter_)
-            line.write(self._quote(value))
-        except StopIteration:
-            return line.getvalue()
-        
-        while True:
-            try:
-                value = self._quote(next(iter_))
-                line.write(delimiter)
-                line.write(value)
-            except StopIteration:
-                break
-        
-        return line.getvalue()
+        prefix = self.dialect.lineterminator if self._needs_newline else ""
+        return prefix + self._delimiter.join([self._quote(value) for value in row])
     
     async def writerow(self, row: RowType) -> Optional[int]:
         res = await self._csvfile.write(self._formatrow(row))
         self._needs_newline = True
         return res
 
-    async def writerows(self, rows: Iterable[RowType]) -> None:
-        for row in rows:
-            await self.writerow(row)
+    async def writerows(self, rows: Iterable[RowType]) -> Optional[int]:
+        """
+        Returns the sum of what csvfile.write returned, or None if any call returned None.
+        """
+        # Collect formatted rows and write them in large pieces rather than once per row.
+        total: Optional[int] = 0
+        buffer = StringIO()
+        try:
+            for row in rows:
+                buffer.write(self._formatrow(row))
+                self._needs_newline = True
+                if buffer.tell() >= _WRITE_BUFFER_SIZE:
+                    data = buffer.getvalue()
+                    buffer = StringIO()
+                    total = _add_written(total, await self._csvfile.write(data))
+        finally:
+            # Rows formatted before an error in rows or _quote are still written, as they
+            # would have been by writerow.
+            if buffer.tell():
+                total = _add_written(total, await self._csvfile.write(buffer.getvalue()))
+
+        return total
@@ -1,13 +1,10 @@
 #!/usr/bin/env python3
 import pathlib
-import sys
 import unittest
 
 from acsv import DictReader
 from acsv.util import AsyncTextFile, aenumerate
 
-assert sys.version_info >= (3, 10)
-
 
 class DictReaderTestCase(unittest.IsolatedAsyncioTestCase):
 
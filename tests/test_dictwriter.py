@@ -1,7 +1,7 @@
 import pathlib
 import unittest
 from typing import Sequence
-from acsv import DictReader, DictWriter
+from acsv import CsvError, DictReader, DictWriter
 from acsv.util import AsyncStringIO
 
 
@@ -46,3 +46,29 @@ Column1,Column2\r
         result_lines = result.split("\n")
         
         self.assertEqual(test_csv_lines, result_lines)
+
+    async def test_extrasaction(self) -> None:
+        row = {"Column1": "1", "Extra": "unused"}
+
+        async with AsyncStringIO(newline="") as fp:
+            writer = DictWriter(fp, fieldnames=["Column1", "Column2"], restval="missing")
+            with self.assertRaises(CsvError):
+                await writer.writerow(row)
+
+            writer = DictWriter(fp, fieldnames=["Column1", "Column2"], restval="missing", extrasaction="ignore")
+            await writer.writerow(row)
+            result = await fp.getvalue()
+
+        self.assertEqual("1,missing", result)
+
+    async def test_extrasaction_in_writerows(self) -> None:
+        rows = [{"a": 1, "b": 2}, {"a": 3, "b": 4}, {"a": 5, "x": 6}]
+
+        async with AsyncStringIO(newline="") as fp:
+            writer = DictWriter(fp, fieldnames=["a", "b"])
+            with self.assertRaises(CsvError):
+                await writer.writerows(rows)
+            await writer.writerow({"a": 7, "b": 8})
+            result = await fp.getvalue()
+
+        self.assertEqual("1,2\r\n3,4\r\n7,8", result)
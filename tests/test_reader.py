@@ -1,12 +1,26 @@
 #!/usr/bin/env python3
+import asyncio
+import io
 import pathlib
-import sys
 import unittest
 
-from acsv import CsvError, Reader
+from acsv import CsvError, Reader, parse_string
 from acsv.util import aenumerate, AsyncStringIO, AsyncTextFile
 
-assert sys.version_info >= (3, 10)
+
+class ThreadedStringIO:
+    """
+    Reads in a worker thread, so a read can still be running when the reader moves on.
+    """
+
+    def __init__(self, text: str) -> None:
+        self._fp = io.StringIO(text, newline="")
+
+    async def read(self, size: int = -1, /) -> str:
+        return await asyncio.to_thread(self._fp.read, size)
+
+    async def write(self, value: str) -> int:
+        return await asyncio.to_thread(self._fp.write, value)
 
 
 class ReaderTestCase(unittest.IsolatedAsyncioTestCase):
@@ -91,7 +105,7 @@ Column1,Column2
             try:
                 row = await anext(iter)
             except CsvError as e:
-                pass
+                self.assertIn("char='q'", str(e))
             except Exception as e:
                 self.fail(f"Caught unexpected: {e}")
             else:
@@ -100,7 +114,7 @@ Column1,Column2
     async def test_bad_escape(self):
         test = """
 Column1,Column2
-123,"This column has a bad \ escape "
+123,"This column has an escape after the closing quote"\,
 """.strip()
         
         async with AsyncStringIO(test, newline='') as fp:
@@ -119,6 +133,100 @@ Column1,Column2
             else:
                 self.fail(f"Got unexpected row: {repr(row)}")
 
+    async def test_quoted_newline(self):
+        test = 'Column1,Column2\r\n1,"This column spans\r\ntwo lines, and has ""quotes"""\r\n2,last\r\n'
+        expected = (
+            ["Column1", "Column2"],
+            ["1", "This column spans\ntwo lines, and has \"quotes\""],
+            ["2", "last"],
+        )
+
+        async with AsyncStringIO(test, newline='') as fp:
+            reader = Reader(fp)
+            rows = [row async for row in reader]
+            self.assertEqual(list(expected), rows)
+            self.assertEqual(4, reader.line_num)
+
+    async def test_small_buffer(self):
+        test = 'Column1,Column2\r\n1,"Quoted, with ""quotes"" and\r\na newline"\r\n2,  spaced\r\n'
+        expected = (
+            ["Column1", "Column2"],
+            ["1", "Quoted, with \"quotes\" and\na newline"],
+            ["2", "spaced"],
+        )
+
+        for buffer_size in range(1, 8):
+            async with AsyncStringIO(test, newline='') as fp:
+                reader = Reader(fp, buffer_size=buffer_size, skipinitialspace=True)
+                await self._run_test(reader, expected)
+
+    async def test_escapechar(self):
+        test = 'Column1,Column2\r\n1\\,2,"This has an escaped \\" quote"\r\nC:\\path,"a\\bc,d"\r\n'
+        expected = (
+            ["Column1", "Column2"],
+            ["1,2", "This has an escaped \" quote"],
+            ["C:path", "abc,d"],
+        )
+
+        for buffer_size in range(1, 8):
+            async with AsyncStringIO(test, newline='') as fp:
+                reader = Reader(fp, buffer_size=buffer_size, escapechar="\\")
+                await self._run_test(reader, expected)
+
+    async def test_read_many(self):
+        test = 'Column1,Column2\r\n1,a\r\n2,b\r\n3,"bad" quote\r\n'
+
+        async with AsyncStringIO(test, newline='') as fp:
+            reader = Reader(fp, buffer_size=4)
+            self.assertEqual([["Column1", "Column2"], ["1", "a"]], await reader.read_many(2))
+            self.assertEqual(["Column1", "Column2"], reader.fieldnames)
+            self.assertEqual([["2", "b"]], await reader.read_many(2))
+            with self.assertRaises(CsvError):
+                await reader.read_many(2)
+
+        async with AsyncStringIO('1,a\r\n2,b', newline='') as fp:
+            reader = Reader(fp)
+            self.assertEqual([["1", "a"], ["2", "b"]], await reader.read_many())
+            self.assertEqual([], await reader.read_many())
+
+    async def test_read_many_after_iteration(self):
+        test = "".join(f"{i},x\r\n" for i in range(10))
+        expected = [[str(i), "x"] for i in range(1, 10)]
+
+        for buffer_size in range(1, 12):
+            async with AsyncStringIO(test, newline='') as fp:
+                reader = Reader(fp, buffer_size=buffer_size)
+                async for row in reader:
+                    self.assertEqual(["0", "x"], row)
+                    break
+                self.assertEqual(expected, await reader.read_many(100))
+
+            async with AsyncStringIO(test, newline='') as fp:
+                reader = Reader(fp, buffer_size=buffer_size)
+                iter = type(reader).__aiter__(reader)
+                self.assertEqual(["0", "x"], await type(iter).__anext__(iter))
+                await iter.aclose()
+                self.assertEqual(expected, await reader.read_many(100))
+
+            reader = Reader(ThreadedStringIO(test), buffer_size=buffer_size)
+            iter = type(reader).__aiter__(reader)
+            self.assertEqual(["0", "x"], await type(iter).__anext__(iter))
+            await asyncio.sleep(0)
+            await iter.aclose()
+            self.assertEqual(expected, await reader.read_many(100))
+
+    def test_parse_string(self):
+        test = 'Column1\tColumn2\r\n1\t"quoted\tvalue"\r\n2\n'
+        expected = [
+            ["Column1", "Column2"],
+            ["1", "quoted\tvalue"],
+            ["2"],
+        ]
+
+        self.assertEqual(expected, parse_string(test, dialect="excel-tab"))
+        with self.assertRaises(CsvError):
+            parse_string('1,"bad" quote\r\n')
+
     async def test_skipinitialwhitespace_on(self):
         test = """
 Column1,Column2\r
@@ -133,6 +241,19 @@ Column1,Column2\r
             reader = Reader(fp, skipinitialspace=True)
             await self._run_test(reader, expected)
 
+    async def test_skipinitialwhitespace_last_line(self):
+        test = 'Column1,Column2\r\n1,  a\r\n  '
+        expected = (
+            ["Column1", "Column2"],
+            ["1", "a"],
+            [""],
+        )
+
+        for buffer_size in range(1, 8):
+            async with AsyncStringIO(test, newline='') as fp:
+                reader = Reader(fp, buffer_size=buffer_size, skipinitialspace=True)
+                self.assertEqual(list(expected), [row async for row in reader])
+
     async def test_skipinitialwhitespace_off(self):
         test = """
 Column1,Column2\r
@@ -41,4 +41,32 @@ Column1,Column2\r
 
         result_lines = result.split("\n")
         
-        self.assertEqual(test_csv_lines, result_lines)
\ No newline at end of file
+        self.assertEqual(test_csv_lines, result_lines)
+
+    async def test_quote_minimal(self) -> None:
+        rows = [
+            ["plain", 1, 2.5],
+            ["has,delimiter", "has \"quote\"", "has\nnewline"],
+        ]
+
+        async with AsyncStringIO(newline="") as fp:
+            writer = Writer(fp)
+            await writer.writerows(rows)
+            result = await fp.getvalue()
+
+        self.assertEqual('plain,1,2.5\r\n"has,delimiter","has ""quote""","has\nnewline"', result)
+
+    async def test_writerows_error(self) -> None:
+        def rows():
+            yield [1, 2]
+            yield [3, 4]
+            raise ValueError("row source failed")
+
+        async with AsyncStringIO(newline="") as fp:
+            writer = Writer(fp)
+            with self.assertRaises(ValueError):
+                await writer.writerows(rows())
+            await writer.writerow([5, 6])
+            result = await fp.getvalue()
+
+        self.assertEqual("1,2\r\n3,4\r\n5,6", result)